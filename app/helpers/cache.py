@@ -25,10 +25,13 @@ def lru_acache(maxsize: int = 128):
     Caches an async function's return value each time it is called.
 
     If the maxsize is reached, the least recently used value is removed.
+
+    Concurrent calls with the same arguments are computed only once, others wait for the first one to finish.
     """
 
     def decorator(func):
         cache: OrderedDict[tuple, Awaitable] = OrderedDict()
+        locks: dict[tuple, asyncio.Lock] = {}
 
         @wraps(func)
         async def wrapper(*args, **kwargs) -> Awaitable:
@@ -44,16 +47,31 @@ def lru_acache(maxsize: int = 128):
                 cache.move_to_end(key)
                 return cache[key]
 
-            # Compute the value since it's not cached
-            value = await func(*args, **kwargs)
-            cache[key] = value
-            cache.move_to_end(key)
-
-            # Remove the least recently used key if the cache is full
-            if len(cache) > maxsize:
-                cache.popitem(last=False)
-
-            return value
+            # Only one coroutine computes the value, others wait for it
+            lock = locks.get(key)
+            if not lock:
+                lock = locks[key] = asyncio.Lock()
+            try:
+                async with lock:
+                    # Value may have been computed while waiting for the lock
+                    if key in cache:
+                        cache.move_to_end(key)
+                        return cache[key]
+
+                    # Compute the value since it's not cached
+                    value = await func(*args, **kwargs)
+                    cache[key] = value
+                    cache.move_to_end(key)
+
+                    # Remove the least recently used key if the cache is full
+                    if len(cache) > maxsize:
+                        cache.popitem(last=False)
+
+                    return value
+            finally:
+                # Lock is not needed anymore once the value is cached or failed
+                if locks.get(key) is lock:
+                    del locks[key]
 
         return wrapper
 
@@ -1,11 +1,10 @@
 import asyncio
-import json
 import re
 import time
 from collections.abc import AsyncGenerator, Awaitable, Callable, Generator
 from contextlib import asynccontextmanager, contextmanager, suppress
 from enum import Enum
-from typing import Any
+from typing import Any, Final
 
 import numpy as np
 from aiojobs import Job, Scheduler
@@ -40,7 +39,7 @@ from azure.communication.callautomation.aio import (
 from azure.core.exceptions import HttpResponseError, ResourceNotFoundError
 from noisereduce import reduce_noise
 
-from app.helpers.cache import lru_acache
+from app.helpers.cache import lru_cache
 from app.helpers.config import CONFIG
 from app.helpers.features import (
     recognition_stt_complete_timeout_ms,
@@ -63,13 +62,18 @@ from app.models.message import (
     StyleEnum as MessageStyleEnum,
 )
 
-_MAX_CHARACTERS_PER_TTS = 400  # Azure Speech Service TTS limit is 400 characters
-_SENTENCE_PUNCTUATION_R = (
-    r"([!?;]+|[\.\-:]+(?:$| ))"  # Split by sentence by punctuation
-)
+# Azure Speech Service TTS limit is 400 characters
+_MAX_CHARACTERS_PER_TTS: Final[int] = 400
+_SENTENCE_PUNCTUATION_R = re.compile(
+    r"([!?;]+|[\.\-:]+(?:$| ))"
+)  # Split by sentence by punctuation
 _TTS_SANITIZER_R = re.compile(
     r"[^\w\sÀ-ÿ'«»“”\"\"‘’''(),.!?;:\-\+_@/&€$%=]"  # noqa: RUF001
 )  # Sanitize text for TTS
+_TTS_SANITIZER_ASCII_T = str.maketrans(
+    {c: " " for c in map(chr, range(128)) if _TTS_SANITIZER_R.match(c)}
+)  # Same as the regex, restricted to ASCII, for the fast path
+_WHITESPACE_R = re.compile(r"\s+")  # Collapse multiple spaces
 
 _db = CONFIG.database.instance
 
@@ -123,32 +127,32 @@ def tts_sentence_split(
 
     Example:
     - Input: "Hello, world! How are you? I'm fine. Thank you... Goodbye!"
-    - Output: [("Hello, world!", 13), ("How are you?", 12), ("I'm fine.", 9), ("Thank you...", 13), ("Goodbye!", 8)]
+    - Output: [("Hello, world!", 13), ("How are you?", 13), ("I'm fine.", 11), ("Thank you...", 13), ("Goodbye!", 8)]
 
     Returns a generator of tuples with the sentence and the original sentence length.
     """
-    # Split by sentence by punctuation
-    splits = re.split(_SENTENCE_PUNCTUATION_R, text)
-    for i, split in enumerate(splits):
-        # Skip punctuation
-        if i % 2 == 1:
-            continue
+    # Split by sentence by punctuation, streaming sentences as they are found
+    last = 0
+    for match in _SENTENCE_PUNCTUATION_R.finditer(text):
+        split = text[last : match.start()]
+        punctuation = match.group()
+        last = match.end()
         # Skip empty lines
         if not split.strip():
             continue
-        # Skip last line in case of missing punctuation
-        if i == len(splits) - 1:
-            if include_last:
-                yield (
-                    split.strip(),
-                    len(split),
-                )
         # Add punctuation back
-        else:
-            yield (
-                split.strip() + splits[i + 1].strip(),
-                len(split) + len(splits[i + 1]),
-            )
+        yield (
+            split.strip() + punctuation.strip(),
+            len(split) + len(punctuation),
+        )
+
+    # Last line is kept only if asked, in case of missing punctuation
+    split = text[last:]
+    if include_last and split.strip():
+        yield (
+            split.strip(),
+            len(split),
+        )
 
 
 async def handle_media(
@@ -164,9 +168,9 @@ async def handle_media(
     """
     with _detect_hangup():
         assert call.voice_id, "Voice ID is required to control the call"
-        call_client = await _use_call_client(client, call.voice_id)
+        call_client = _use_call_client(client, call.voice_id)
         await call_client.play_media(
-            operation_context=_context_serializer({context}),
+            operation_context=_context_serializer_single(context),
             play_source=FileSource(url=sound_url),
         )
 
@@ -193,7 +197,7 @@ async def handle_automation_tts(  # noqa: PLR0913
     # Play each chunk
     jobs: list[Job] = []
     chunks = _chunk_for_tts(text)
-    call_client = await _use_call_client(client, call.voice_id)
+    call_client = _use_call_client(client, call.voice_id)
     jobs += [
         await scheduler.spawn(
             _automation_play_text(
@@ -250,7 +254,7 @@ async def _automation_play_text(
     with _detect_hangup():
         assert call.voice_id, "Voice ID is required to control the call"
         await call_client.play_media(
-            operation_context=_context_serializer({context}),
+            operation_context=_context_serializer_single(context),
             play_source=_ssml_from_text(
                 call=call,
                 style=style,
@@ -275,7 +279,7 @@ async def handle_realtime_tts(  # noqa: PLR0913
     # Play each chunk
     chunks = _chunk_for_tts(text)
     for chunk in chunks:
-        logger.info("Playing TTS: %s", text)
+        logger.info("Playing TTS: %s", chunk)
         tts_client.speak_ssml_async(
             _ssml_from_text(
                 call=call,
@@ -320,31 +324,37 @@ def _chunk_for_tts(
     text: str,
 ) -> list[str]:
     """
-    Split a text in chunks and store them in the call messages.
+    Split a text in chunks.
 
-    Chunks are separated by sentences and are limited to the TTS capacity.
+    Chunks are separated by sentences and are limited to the TTS capacity. Pure CPU work, storage of the message is done separately by the caller.
     """
     # Sanitize text for TTS
-    text = re.sub(_TTS_SANITIZER_R, " ", text)  # Remove unwanted characters
-    text = re.sub(r"\s+", " ", text)  # Remove multiple spaces
+    # Remove unwanted characters, the translation table is only faster than the regex for ASCII
+    if text.isascii():
+        text = text.translate(_TTS_SANITIZER_ASCII_T)
+    else:
+        text = _TTS_SANITIZER_R.sub(" ", text)
+    text = _WHITESPACE_R.sub(" ", text)  # Remove multiple spaces
 
     # Split text in chunks, separated by sentence
     chunks = []
-    chunk = ""
+    sentences: list[str] = []
+    length = 0  # Length of the sentences, plus the spaces separating them
     for to_add, _ in tts_sentence_split(text, True):
         # If chunck overflows TTS capacity, start a new record
-        if len(chunk) + len(to_add) >= _MAX_CHARACTERS_PER_TTS:
-            # Remove trailing space as sentences are separated by spaces
-            chunks.append(chunk.strip())
+        if sentences and length + len(to_add) >= _MAX_CHARACTERS_PER_TTS:
+            # Sentences are separated by spaces
+            chunks.append(" ".join(sentences))
             # Reset chunk
-            chunk = ""
-        # Add space to separate sentences
-        chunk += to_add + " "
+            sentences.clear()
+            length = 0
+        sentences.append(to_add)
+        length += len(to_add) + 1
 
     # If there is a remaining chunk, add it
-    if chunk:
-        # Remove trailing space as sentences are separated by spaces
-        chunks.append(chunk.strip())
+    if sentences:
+        # Sentences are separated by spaces
+        chunks.append(" ".join(sentences))
 
     return chunks
 
@@ -367,8 +377,7 @@ def _ssml_from_text(
     # Escape text for SSML
     text = text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
     # Build SSML tree
-    ssml = f"""
-    <speak version="1.0" xmlns="http://www.w3.org/2001/10/synthesis" xmlns:mstts="https://www.w3.org/2001/mstts" xml:lang="{call.lang.short_code}">
+    ssml = f"""<speak version="1.0" xmlns="http://www.w3.org/2001/10/synthesis" xmlns:mstts="https://www.w3.org/2001/mstts" xml:lang="{call.lang.short_code}">
         <voice name="{call.lang.voice}" effect="eq_telecomhp8k">
             <lexicon uri="{CONFIG.resources.public_url}/lexicon.xml" />
             <lang xml:lang="{call.lang.short_code}">
@@ -377,11 +386,10 @@ def _ssml_from_text(
                 </mstts:express-as>
             </lang>
         </voice>
-    </speak>
-    """
+    </speak>"""
     return SsmlSource(
         custom_voice_endpoint_id=call.lang.custom_voice_endpoint_id,
-        ssml_text=ssml.strip(),
+        ssml_text=ssml,
     )
 
 
@@ -400,12 +408,12 @@ async def handle_recognize_ivr(
     logger.info("Recognizing IVR: %s", text)
     try:
         assert call.voice_id, "Voice ID is required to control the call"
-        call_client = await _use_call_client(client, call.voice_id)
+        call_client = _use_call_client(client, call.voice_id)
         await call_client.start_recognizing_media(
             choices=choices,
             input_type=RecognizeInputType.CHOICES,
             interrupt_prompt=True,
-            operation_context=_context_serializer({context}),
+            operation_context=_context_serializer_single(context),
             play_prompt=_ssml_from_text(
                 call=call,
                 style=MessageStyleEnum.NONE,
@@ -435,7 +443,7 @@ async def handle_hangup(
         _detect_hangup(),
     ):
         assert call.voice_id, "Voice ID is required to control the call"
-        call_client = await _use_call_client(client, call.voice_id)
+        call_client = _use_call_client(client, call.voice_id)
         await call_client.hang_up(is_for_everyone=True)
 
 
@@ -453,9 +461,9 @@ async def handle_transfer(
     logger.info("Transferring call: %s", target)
     with _detect_hangup():
         assert call.voice_id, "Voice ID is required to control the call"
-        call_client = await _use_call_client(client, call.voice_id)
+        call_client = _use_call_client(client, call.voice_id)
         await call_client.transfer_call_to_participant(
-            operation_context=_context_serializer({context}),
+            operation_context=_context_serializer_single(context),
             target_participant=PhoneNumberIdentifier(target),
         )
 
@@ -472,7 +480,7 @@ async def start_audio_streaming(
     logger.info("Starting audio streaming")
     with _detect_hangup():
         assert call.voice_id, "Voice ID is required to control the call"
-        call_client = await _use_call_client(client, call.voice_id)
+        call_client = _use_call_client(client, call.voice_id)
         # TODO: Use the public API once the "await" have been fixed
         # await call_client.start_media_streaming()
         await call_client._call_media_client.start_media_streaming(
@@ -493,19 +501,21 @@ async def stop_audio_streaming(
     logger.info("Stopping audio streaming")
     with _detect_hangup():
         assert call.voice_id, "Voice ID is required to control the call"
-        call_client = await _use_call_client(client, call.voice_id)
+        call_client = _use_call_client(client, call.voice_id)
         await call_client.stop_media_streaming()
 
 
-def _context_serializer(contexts: set[ContextEnum | None] | None) -> str | None:
+def _context_serializer_single(context: ContextEnum | None) -> str | None:
     """
-    Serialize a set of contexts to a JSON string.
+    Serialize a context to a JSON array string, as `'["<value>"]'`.
+
+    JSON is formatted manually, as enum values are JSON-safe.
 
     Returns `None` if no context is provided.
     """
-    if not contexts:
+    if not context:
         return None
-    return json.dumps([context.value for context in contexts if context])
+    return f'["{context.value}"]'
 
 
 @contextmanager
@@ -526,12 +536,14 @@ def _detect_hangup() -> Generator[None, None, None]:
             raise e
 
 
-@lru_acache()
-async def _use_call_client(
+@lru_cache()
+def _use_call_client(
     client: CallAutomationClient, voice_id: str
 ) -> CallConnectionClient:
     """
     Return the call client for a given call.
+
+    Sync, as building the client does not do any I/O.
     """
     logger.debug("Using Call client for %s", voice_id)
 
@@ -4,6 +4,7 @@ from typing import Annotated, Any
 from pydantic import BaseModel, ConfigDict, EmailStr, Field, create_model
 from pydantic.fields import FieldInfo
 
+from app.helpers.cache import lru_cache
 from app.helpers.pydantic_types.phone_numbers import PhoneNumber
 from app.models.claim import ClaimFieldModel, ClaimTypeEnum
 
@@ -136,7 +137,7 @@ class WorkflowInitiateModel(BaseModel):
     def claim_model(self) -> type[BaseModel]:
         return _fields_to_pydantic(
             name="ClaimEntryModel",
-            fields=[
+            fields=(
                 *self.claim,
                 ClaimFieldModel(
                     description="Email of the customer",
@@ -153,7 +154,7 @@ class WorkflowInitiateModel(BaseModel):
                     name="policyholder_phone",
                     type=ClaimTypeEnum.PHONE_NUMBER,
                 ),
-            ],
+            ),
         )
 
 
@@ -162,7 +163,10 @@ class ConversationModel(BaseModel):
     initiate: WorkflowInitiateModel
 
 
-def _fields_to_pydantic(name: str, fields: list[ClaimFieldModel]) -> type[BaseModel]:
+@lru_cache()  # Model is validated with each call, building it is expensive
+def _fields_to_pydantic(
+    name: str, fields: tuple[ClaimFieldModel, ...]
+) -> type[BaseModel]:
     field_definitions = {field.name: _field_to_pydantic(field) for field in fields}
     return create_model(
         name,
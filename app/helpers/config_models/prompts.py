@@ -376,7 +376,7 @@ class LlmModel(BaseModel):
             self._format(
                 self.synthesis_system_tpl,
                 claim=json.dumps(call.claim),
-                format=json.dumps(SynthesisModel.model_json_schema()),
+                format=self.synthesis_format,
                 messages=TypeAdapter(list[MessageModel])
                 .dump_json(call.messages, exclude_none=True)
                 .decode(),
@@ -411,7 +411,7 @@ class LlmModel(BaseModel):
             self._format(
                 self.next_system_tpl,
                 claim=json.dumps(call.claim),
-                format=json.dumps(NextModel.model_json_schema()),
+                format=self.next_format,
                 messages=TypeAdapter(list[MessageModel])
                 .dump_json(call.messages, exclude_none=True)
                 .decode(),
@@ -429,8 +429,8 @@ class LlmModel(BaseModel):
         trainings: list[TrainingModel] | None = None,
         **kwargs: str,
     ) -> str:
-        # Remove possible indentation then render the template
-        formatted_prompt = dedent(prompt_tpl.format(**kwargs)).strip()
+        # Render the template, indentation is removed below when joining lines
+        formatted_prompt = prompt_tpl.format(**kwargs).strip()
 
         # Format trainings, if any
         if trainings:
@@ -465,6 +465,20 @@ class LlmModel(BaseModel):
         # self.logger.debug("Messages: %s", messages)
         return messages
 
+    @cached_property
+    def synthesis_format(self) -> str:
+        """
+        JSON schema of the synthesis response, cached as it is expensive to build.
+        """
+        return json.dumps(SynthesisModel.model_json_schema())
+
+    @cached_property
+    def next_format(self) -> str:
+        """
+        JSON schema of the next action response, cached as it is expensive to build.
+        """
+        return json.dumps(NextModel.model_json_schema())
+
     @cached_property
     def logger(self) -> Logger:
         from app.helpers.logging import logger
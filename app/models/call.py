@@ -1,5 +1,5 @@
 import asyncio
-import random
+import secrets
 import string
 from datetime import UTC, datetime, tzinfo
 from typing import Any
@@ -23,6 +23,9 @@ from app.models.reminder import ReminderModel
 from app.models.synthesis import SynthesisModel
 from app.models.training import TrainingModel
 
+_CALLBACK_SECRET_ALPHABET = string.ascii_letters + string.digits
+_CALLBACK_SECRET_RANDOM = secrets.SystemRandom()
+
 
 class CallInitiateModel(WorkflowInitiateModel):
     phone_number: PhoneNumber
@@ -95,8 +98,8 @@ class CallGetModel(BaseModel):
 class CallStateModel(CallGetModel, extra="ignore"):
     # Immutable fields
     callback_secret: str = Field(
-        default="".join(
-            random.choice(string.ascii_letters + string.digits) for _ in range(16)
+        default_factory=lambda: "".join(
+            _CALLBACK_SECRET_RANDOM.choices(_CALLBACK_SECRET_ALPHABET, k=16)
         ),
         frozen=True,
     )
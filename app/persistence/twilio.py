@@ -38,9 +38,8 @@ class TwilioSms(ISms):
         return ReadinessEnum.FAIL
 
     async def send(self, content: str, phone_number: PhoneNumber) -> bool:
-        logger.info("Sending SMS to %s", phone_number)
+        logger.info("Sending SMS to %s: %s", phone_number, content)
         success = False
-        logger.info("SMS content: %s", content)
         client = await self._use_client()
         try:
             res = await client.messages.create_async(
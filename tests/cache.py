@@ -1,6 +1,9 @@
+import asyncio
+
 import pytest
 from pytest_assume.plugin import assume
 
+from app.helpers.cache import lru_acache
 from app.helpers.config import CONFIG
 from app.helpers.config_models.cache import ModeEnum as CacheModeEnum
 
@@ -55,3 +58,64 @@ async def test_acid(
 
     # Check point read
     assume(await cache.get(test_key) == test_value.encode())
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_lru_acache_concurrent() -> None:
+    """
+    Test concurrent calls to an async cached function.
+
+    Steps:
+    1. Call the function concurrently with the same arguments
+    2. Check the function was executed once
+    3. Check all callers got the same value
+    """
+    calls = 0
+
+    @lru_acache()
+    async def _build(key: str) -> object:  # noqa: ARG001
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.1)  # Let other callers wait for the value
+        return object()
+
+    # Call concurrently
+    values = await asyncio.gather(*[_build("lorem") for _ in range(50)])
+
+    # Check function was executed once
+    assume(calls == 1)
+
+    # Check all callers got the same value
+    assume(all(value is values[0] for value in values))
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_lru_acache_exception() -> None:
+    """
+    Test an async cached function raising an exception.
+
+    Steps:
+    1. Call the function, which fails
+    2. Call it again, which succeeds
+    3. Call it a last time, which is served from the cache
+    """
+    calls = 0
+
+    @lru_acache()
+    async def _build(key: str) -> object:  # noqa: ARG001
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            raise ValueError("Failed to build")
+        return object()
+
+    # First call fails and is not cached
+    with pytest.raises(ValueError):
+        await _build("lorem")
+
+    # Second call recomputes the value
+    value = await _build("lorem")
+
+    # Third call is served from the cache
+    assume(await _build("lorem") is value)
+    assume(calls == 2)  # noqa: PLR2004
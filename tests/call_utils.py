@@ -0,0 +1,144 @@
+import re
+
+import pytest
+from pytest_assume.plugin import assume
+
+from app.helpers.call_utils import (
+    _MAX_CHARACTERS_PER_TTS,
+    _chunk_for_tts,
+    tts_sentence_split,
+)
+
+
+@pytest.mark.parametrize(
+    "include_last, expected",
+    [
+        pytest.param(
+            True,
+            [
+                ("Hello, world!", 13),
+                ("How are you?", 13),
+                ("I'm fine.", 11),
+                ("Thank you...", 13),
+                ("Goodbye", 7),
+            ],
+            id="include_last",
+        ),
+        pytest.param(
+            False,
+            [
+                ("Hello, world!", 13),
+                ("How are you?", 13),
+                ("I'm fine.", 11),
+                ("Thank you...", 13),
+            ],
+            id="exclude_last",
+        ),
+    ],
+)
+def test_tts_sentence_split(
+    expected: list[tuple[str, int]],
+    include_last: bool,
+) -> None:
+    """
+    Test the sentence split used for TTS.
+
+    Steps:
+    1. Split the text
+    2. Check the sentences and their original lengths
+    """
+    text = "Hello, world! How are you? I'm fine. Thank you... Goodbye"
+    assume(list(tts_sentence_split(text, include_last)) == expected)
+
+
+def test_tts_sentence_split_streaming() -> None:
+    """
+    Test the sentence split on a streamed text, as done with LLM completions.
+
+    Steps:
+    1. Stream the text word by word, moving a buffer pointer with the returned lengths
+    2. Check each sentence is returned once, when it is complete
+    3. Check the pointer stops at the start of the unfinished sentence
+    """
+    text = "Hello, world!  How are you? I'm fine; thank you... Goodbye"
+
+    # Stream the text, like the LLM completion does
+    content_full = ""
+    content_buffer_pointer = 0
+    sentences = []
+    for token in re.findall(r"\S+\s*", text):
+        content_full += token
+        for sentence, length in tts_sentence_split(
+            content_full[content_buffer_pointer:], False
+        ):
+            content_buffer_pointer += length
+            sentences.append(sentence)
+
+    # Check each sentence is returned once
+    assume(sentences == ["Hello, world!", "How are you?", "I'm fine;", "thank you..."])
+
+    # Check the pointer stops at the start of the unfinished sentence
+    assume(content_full[content_buffer_pointer:] == "Goodbye")
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        pytest.param(
+            "Hello, world! How are you?",
+            ["Hello, world! How are you?"],
+            id="short",
+        ),
+        pytest.param(
+            f"{'a' * 450}. Hello, world!",
+            [f"{'a' * 450}.", "Hello, world!"],
+            id="first_sentence_too_long",
+        ),
+        pytest.param(
+            "",
+            [],
+            id="empty",
+        ),
+    ],
+)
+def test_chunk_for_tts(
+    expected: list[str],
+    text: str,
+) -> None:
+    """
+    Test the text chunking before TTS.
+
+    Steps:
+    1. Chunk the text
+    2. Check the chunks
+
+    A sentence longer than the TTS limit is kept in its own chunk, without an empty chunk before it.
+    """
+    assume(_chunk_for_tts(text) == expected)
+
+
+def test_chunk_for_tts_sentences() -> None:
+    """
+    Test long texts are split at sentence boundaries.
+
+    Steps:
+    1. Chunk a text longer than the TTS limit
+    2. Check no chunk is empty or over the limit
+    3. Check each chunk ends with a full sentence
+    4. Check no text is lost
+    """
+    text = " ".join(f"This is the sentence number {i}." for i in range(50))
+
+    # Chunk the text
+    chunks = _chunk_for_tts(text)
+    assume(len(chunks) > 1)
+
+    for chunk in chunks:
+        # Check no chunk is empty or over the limit
+        assume(0 < len(chunk) < _MAX_CHARACTERS_PER_TTS)
+        # Check each chunk ends with a full sentence
+        assume(chunk.startswith("This is the sentence number "))
+        assume(chunk.endswith("."))
+
+    # Check no text is lost
+    assume(" ".join(chunks) == text)